@@ -1,6 +1,59 @@
+import functools
 import tkinter as tk
 import math
 
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _pmt_kernel(loan_amount, interest_rate_month, number_of_payments):
+    exponent = int(number_of_payments)
+    if exponent == number_of_payments and 0 < exponent <= 64:
+        # Square-and-multiply beats libm pow for small integer exponents.
+        compound_factor = 1.0
+        base = 1.0 + interest_rate_month
+        while exponent:
+            if exponent & 1:
+                compound_factor *= base
+            base *= base
+            exponent >>= 1
+        compound_factor_less_one = compound_factor - 1.0
+    else:
+        compound_factor_less_one = math.expm1(
+            number_of_payments * math.log1p(interest_rate_month)
+        )
+    return (
+        loan_amount * interest_rate_month *
+        (compound_factor_less_one + 1.0) / compound_factor_less_one
+    )
+
+
+def _nper_kernel(loan_amount, interest_rate_month, monthly_payment_total):
+    return (
+        -math.log1p(-interest_rate_month * loan_amount / monthly_payment_total) /
+        math.log1p(interest_rate_month)
+    )
+
+
+if numba is not None:
+    _pmt_kernel = numba.njit(
+        'float64(float64, float64, float64)', cache=True, fastmath=True
+    )(_pmt_kernel)
+    _nper_kernel = numba.njit(
+        'float64(float64, float64, float64)', cache=True, fastmath=True
+    )(_nper_kernel)
+
+
+class LoanInputError(ValueError):
+    """Raised when a loan or salary parameter is invalid.
+
+    The exception message is the text to show in the GUI.
+    """
+
 
 def check_loan_parameters(loan_amount, interest_rate_year, loan_term, loan_term_units):
     """Checks that the parameters of the loan are valid.
@@ -10,29 +63,123 @@ def check_loan_parameters(loan_amount, interest_rate_year, loan_term, loan_term_
         interest_rate_year (float) interest rate (%)
         loan_term (int): length of loan (units in loan_term_units)
         loan_term_units (str): "months" or "years", unit of loan_term
-        
-    Returns:
-        (str) the error message to show if a parameter is invalid or
-        None if all parameters are valid
+
+    Raises:
+        LoanInputError: if any parameter is invalid
     """
     if loan_amount == 0:
-        return("Please enter valid loan amount")
+        raise LoanInputError("Please enter valid loan amount")
 
     if interest_rate_year == 0:
-        return("Please enter valid interest rate")
+        raise LoanInputError("Please enter valid interest rate")
 
     if loan_term == 0:
-        return("Please enter valid loan term")
+        raise LoanInputError("Please enter valid loan term")
 
     if (loan_term_units != "months") and (loan_term_units != "years"):
-        return("Please select 'years' or 'months' for the loan term")
+        raise LoanInputError("Please select 'years' or 'months' for the loan term")
 
 
 def fill_missing_fields(entries, fields_to_fill):
     for field in fields_to_fill:
-        if entries[field].get().strip() == "":
-            entries[field].delete(0, tk.END)
-            entries[field].insert(0, "0")
+        try:
+            entries[field].get()
+        except tk.TclError:
+            entries[field].set(0.0)
+
+
+@functools.lru_cache(maxsize=256)
+def _calculate_monthly_payment_cached(loan_amount, interest_rate_month, number_of_payments):
+    return _pmt_kernel(loan_amount, interest_rate_month, number_of_payments)
+
+
+@functools.lru_cache(maxsize=256)
+def _calculate_time_to_repay_cached(loan_amount, interest_rate_month, monthly_payment_total):
+    return _nper_kernel(loan_amount, interest_rate_month, monthly_payment_total)
+
+
+def calculate_monthly_payment_vec(loan_amount, interest_rate_year, loan_term_months):
+    """Calculates monthly payments for arrays of loan scenarios.
+
+    All parameters broadcast against each other, so any of them may be a
+    scalar or an array (e.g. one loan amount against a curve of rates).
+
+    Params:
+        loan_amount (array_like): loan amount(s) in dollars
+        interest_rate_year (array_like): interest rate(s) (%)
+        loan_term_months (array_like): length(s) of loan in months
+
+    Returns:
+        (np.ndarray) amount of each month's payment per scenario
+    """
+    loan_amount = np.asarray(loan_amount, dtype=float)
+    interest_rate_month = np.asarray(interest_rate_year, dtype=float) / 1200.0
+    number_of_payments = np.asarray(loan_term_months)
+
+    compound_factor = np.power(1.0 + interest_rate_month, number_of_payments)
+    return loan_amount * interest_rate_month * compound_factor / (compound_factor - 1.0)
+
+
+def calculate_time_to_repay_vec(loan_amount, interest_rate_year, monthly_payment_total):
+    """Calculates repayment times for arrays of loan scenarios.
+
+    All parameters broadcast against each other, so any of them may be a
+    scalar or an array.
+
+    Params:
+        loan_amount (array_like): loan amount(s) in dollars
+        interest_rate_year (array_like): interest rate(s) (%)
+        monthly_payment_total (array_like): total payment(s) made each month
+
+    Returns:
+        (np.ndarray) number of payments required to repay each scenario
+    """
+    loan_amount = np.asarray(loan_amount, dtype=float)
+    interest_rate_month = np.asarray(interest_rate_year, dtype=float) / 1200.0
+    monthly_payment_total = np.asarray(monthly_payment_total, dtype=float)
+
+    return (
+        -np.log1p(-interest_rate_month * loan_amount / monthly_payment_total) /
+        np.log1p(interest_rate_month)
+    )
+
+
+def make_payment_fn(interest_rate_year):
+    """Makes a payment function specialized to a fixed annual rate.
+
+    Useful for rate-comparison sweeps: the monthly rate is derived once
+    when the function is built instead of on every call.
+
+    Params:
+        interest_rate_year (float): annual interest rate (%)
+
+    Returns:
+        (callable) payment(loan_amount, loan_term_months) -> (float)
+        amount of each month's payment at the baked-in rate
+    """
+    interest_rate_month = interest_rate_year / 1200.0
+
+    def payment(loan_amount, loan_term_months, _rate=interest_rate_month):
+        return _pmt_kernel(float(loan_amount), _rate, float(loan_term_months))
+
+    return payment
+
+
+def payment_grid(loan_amount, interest_rates_year, loan_terms_months):
+    """Calculates monthly payments over a rate/term sensitivity grid.
+
+    Params:
+        loan_amount (float): loan amount in dollars
+        interest_rates_year (array_like): interest rates to sweep (%)
+        loan_terms_months (array_like): loan terms to sweep, in months
+
+    Returns:
+        (np.ndarray) matrix of monthly payments, one row per rate and
+        one column per term
+    """
+    rates = np.asarray(interest_rates_year, dtype=float).reshape(-1, 1)
+    terms = np.asarray(loan_terms_months).reshape(1, -1)
+    return calculate_monthly_payment_vec(loan_amount, rates, terms)
 
 
 def calculate_monthly_payment(loan_amount, interest_rate_year, loan_term, loan_term_units="years"):
@@ -43,29 +190,28 @@ def calculate_monthly_payment(loan_amount, interest_rate_year, loan_term, loan_t
         interest_rate_year (float) interest rate (%)
         loan_term (int): length of loan (units in loan_term_units)
         loan_term_units (str): "months" or "years", unit of loan_term
-        
+
     Returns:
-        (float) amount of each month's payment or (str) the message to show
-    """
-    param_check = check_loan_parameters(loan_amount, interest_rate_year, loan_term, loan_term_units)
+        (float) amount of each month's payment
 
-    if isinstance(param_check, str):
-        return param_check
+    Raises:
+        LoanInputError: if any loan parameter is invalid
+    """
+    check_loan_parameters(loan_amount, interest_rate_year, loan_term, loan_term_units)
 
-    interest_rate_month = interest_rate_year / 12
-    
     if loan_term_units == "years":
         number_of_payments = loan_term * 12
     elif loan_term_units == "months":
         number_of_payments = loan_term
-        
-    monthly_payment = (
-        loan_amount * interest_rate_month / 100 *
-        (1 + interest_rate_month / 100) ** number_of_payments /
-        ((1 + interest_rate_month / 100) ** number_of_payments - 1)
+
+    # Quantize to cents and 1e-4 % so equivalent UI inputs share a cache key
+    # regardless of float round-tripping.
+    loan_amount = round(loan_amount * 100.0) / 100.0
+    interest_rate_year = round(interest_rate_year * 10000.0) / 10000.0
+
+    return _calculate_monthly_payment_cached(
+        float(loan_amount), interest_rate_year / 1200.0, float(number_of_payments)
     )
-    
-    return monthly_payment
 
 
 def calculate_time_to_repay(loan_amount, interest_rate_year, loan_term, loan_term_units="years", monthly_payment_additional=0):
@@ -77,15 +223,13 @@ def calculate_time_to_repay(loan_amount, interest_rate_year, loan_term, loan_ter
         loan_term (int): length of loan (units in loan_term_units)
         loan_term_units (string, optional): "months" or "years", unit of loan_term
         monthly_payment_additional (float, optional): additional monthly payment amount for earlier payoff
-        
-    Returns:
-        (float) number of payments required to repay the loan or (str) the message to show
-    """
-    param_check = check_loan_parameters(loan_amount, interest_rate_year, loan_term, loan_term_units)
 
-    if isinstance(param_check, str):
-        return param_check
+    Returns:
+        (float) number of payments required to repay the loan
 
+    Raises:
+        LoanInputError: if any loan parameter is invalid
+    """
     monthly_payment_base = calculate_monthly_payment(
         loan_amount,
         interest_rate_year,
@@ -93,14 +237,15 @@ def calculate_time_to_repay(loan_amount, interest_rate_year, loan_term, loan_ter
         loan_term_units=loan_term_units
     )
     
-    interest_rate_month = interest_rate_year / 12
-    
-    number_of_payments_required = (
-        - math.log(1 - (interest_rate_month / 100 * loan_amount / (monthly_payment_base + monthly_payment_additional))) /
-        math.log(1 + interest_rate_month / 100)
+    loan_amount = round(loan_amount * 100.0) / 100.0
+    interest_rate_year = round(interest_rate_year * 10000.0) / 10000.0
+    monthly_payment_total = round((monthly_payment_base + monthly_payment_additional) * 100.0) / 100.0
+
+    return _calculate_time_to_repay_cached(
+        float(loan_amount),
+        interest_rate_year / 1200.0,
+        monthly_payment_total
     )
-    
-    return number_of_payments_required
 
 
 def calculate_monthly_takehome(salary_base, effective_tax_rate, annual_savings):
@@ -112,40 +257,87 @@ def calculate_monthly_takehome(salary_base, effective_tax_rate, annual_savings):
         annual_retirement_contribution (float): amount to contribute to retirement per year
         
     Returns:
-        (float) monthly takehome salary or (str) the message to show
+        (float) monthly takehome salary
+
+    Raises:
+        LoanInputError: if the salary is invalid
     """
 
     if salary_base == 0:
-        return("Please enter valid salary")
-    
+        raise LoanInputError("Please enter valid salary")
+
+
     salary_takehome = salary_base * (1 - effective_tax_rate / 100) - annual_savings
     return (salary_takehome / 12)
 
 
+def net_monthly_cash(salary_base, effective_tax_rate, annual_savings, monthly_loan_payment, monthly_payment_additional):
+    """Calculate monthly cash left after taxes, savings, and loan payments.
+
+    Params:
+        salary_base (float): annual base salary
+        effective_tax_rate (float): estimate of effective tax rate
+        annual_savings (float): amount to save per year
+        monthly_loan_payment (float): base monthly loan payment
+        monthly_payment_additional (float): additional monthly loan payment
+
+    Returns:
+        (float) monthly take-home salary net of loan payments
+
+    Raises:
+        LoanInputError: if the salary is invalid
+    """
+    if salary_base == 0:
+        raise LoanInputError("Please enter valid salary")
+
+    return (
+        (salary_base * (1.0 - effective_tax_rate / 100.0) - annual_savings) / 12.0 -
+        monthly_loan_payment - monthly_payment_additional
+    )
+
+
+def _read_inputs(entries, fields):
+    """Reads and parses the given numeric GUI fields in one pass.
+
+    Params:
+        entries (dict): dictionary of GUI entries
+        fields (list): names of the numeric fields to read
+
+    Returns:
+        (dict) mapping of field name to its float value
+    """
+    fill_missing_fields(entries, fields)
+    return {field: entries[field].get() for field in fields}
+
+
 def call_calculate_time_to_repay(entries):
     """Wrapper for calculate_time_tor_repay.
 
     Params:
         entries (dict): dictionary of GUI entries
     """
-    fill_missing_fields(
+    values = _read_inputs(
         entries,
         ["Loan Amount", "Annual Interest Rate", "Loan Term", "Additional Monthly Payment"]
     )
-    time_to_repay = calculate_time_to_repay(
-        float(entries["Loan Amount"].get()),
-        float(entries["Annual Interest Rate"].get()),
-        float(entries["Loan Term"].get()),
-        loan_term_units=str(entries["Loan Term Units"].get()),
-        monthly_payment_additional=float(entries["Additional Monthly Payment"].get())
-    )
-    entries["Time to Repay"].delete(0, tk.END)
-    if str(entries["Repay Time Units"].get()) == "months":
-        entries["Time to Repay"].insert(0, "{:d}".format(math.ceil(time_to_repay)))
-    elif str(entries["Repay Time Units"].get()) == "years":
-        entries["Time to Repay"].insert(0, "{:.1f}".format(time_to_repay/12))
+    repay_time_units = str(entries["Repay Time Units"].get())
+    try:
+        time_to_repay = calculate_time_to_repay(
+            values["Loan Amount"],
+            values["Annual Interest Rate"],
+            values["Loan Term"],
+            loan_term_units=str(entries["Loan Term Units"].get()),
+            monthly_payment_additional=values["Additional Monthly Payment"]
+        )
+    except LoanInputError as error:
+        entries["Time to Repay"].set(str(error))
+        return
+    if repay_time_units == "months":
+        entries["Time to Repay"].set(math.ceil(time_to_repay))
+    elif repay_time_units == "years":
+        entries["Time to Repay"].set(round(time_to_repay / 12, 1))
     else:
-        entries["Time to Repay"].insert(0, "Please select 'years' or 'months'")
+        entries["Time to Repay"].set("Please select 'years' or 'months'")
 
 
 def call_calculate_total_monthly_payment(entries):
@@ -154,22 +346,22 @@ def call_calculate_total_monthly_payment(entries):
     Params:
         entries (dict): dictionary of GUI entries
     """
-    fill_missing_fields(
+    values = _read_inputs(
         entries,
         ["Loan Amount", "Annual Interest Rate", "Loan Term", "Additional Monthly Payment"]
     )
-    monthly_payment_base = calculate_monthly_payment(
-        float(entries["Loan Amount"].get()),
-        float(entries["Annual Interest Rate"].get()),
-        float(entries["Loan Term"].get()),
-        loan_term_units=str(entries["Loan Term Units"].get()),
-    )
-    entries["Total Monthly Payment"].delete(0, tk.END)
-    if not isinstance(monthly_payment_base, str):
-        total_monthly_payment = monthly_payment_base + float(entries["Additional Monthly Payment"].get())
-        entries["Total Monthly Payment"].insert(0, "{:.2f}".format(total_monthly_payment))
-    else:
-        entries["Total Monthly Payment"].insert(0, monthly_payment_base)
+    try:
+        monthly_payment_base = calculate_monthly_payment(
+            values["Loan Amount"],
+            values["Annual Interest Rate"],
+            values["Loan Term"],
+            loan_term_units=str(entries["Loan Term Units"].get()),
+        )
+    except LoanInputError as error:
+        entries["Total Monthly Payment"].set(str(error))
+        return
+    total_monthly_payment = monthly_payment_base + values["Additional Monthly Payment"]
+    entries["Total Monthly Payment"].set(round(total_monthly_payment, 2))
 
 
 def call_calculate_monthly_takehome(entries):
@@ -178,33 +370,115 @@ def call_calculate_monthly_takehome(entries):
     Params:
         entries (dict): dictionary of GUI entries
     """
-    fill_missing_fields(
+    values = _read_inputs(
         entries,
         ["Loan Amount", "Annual Interest Rate", "Loan Term", "Additional Monthly Payment", "Salary", "Effective Tax Rate", "Annual Savings Target"]
     )
-    monthly_takehome = calculate_monthly_takehome(
-        float(entries["Salary"].get()),
-        float(entries["Effective Tax Rate"].get()),
-        float(entries["Annual Savings Target"].get()),
+    try:
+        if values["Loan Amount"] == 0:
+            monthly_payment_base = 0
+            additional_monthly_payment = float(0)
+        else:
+            monthly_payment_base = calculate_monthly_payment(
+                values["Loan Amount"],
+                values["Annual Interest Rate"],
+                values["Loan Term"],
+                loan_term_units=str(entries["Loan Term Units"].get()),
+            )
+            additional_monthly_payment = values["Additional Monthly Payment"]
+        monthly_cash = net_monthly_cash(
+            values["Salary"],
+            values["Effective Tax Rate"],
+            values["Annual Savings Target"],
+            monthly_payment_base,
+            additional_monthly_payment,
+        )
+    except LoanInputError as error:
+        entries["Monthly Take-home Salary"].set(str(error))
+        return
+    entries["Monthly Take-home Salary"].set(round(monthly_cash, 2))
+
+
+def call_show_payment_grid(entries):
+    """Wrapper for payment_grid.
+
+    Sweeps rates around the entered interest rate against a range of loan
+    terms and writes the payment table to the amortization Text widget.
+
+    Params:
+        entries (dict): dictionary of GUI entries
+    """
+    values = _read_inputs(entries, ["Loan Amount", "Annual Interest Rate"])
+    text = entries["Amortization Table"]
+    text.delete("1.0", tk.END)
+    try:
+        loan_amount = values["Loan Amount"]
+        interest_rate_year = values["Annual Interest Rate"]
+        check_loan_parameters(loan_amount, interest_rate_year, 1, "months")
+    except LoanInputError as error:
+        text.insert(tk.END, str(error))
+        return
+    rates = interest_rate_year + np.arange(-1.0, 1.25, 0.25)
+    rates = rates[rates > 0]
+    terms_months = np.arange(5, 35, 5) * 12
+    grid = payment_grid(loan_amount, rates, terms_months)
+    lines = [
+        "rate (%)" + "".join("{:>10d} mo".format(term) for term in terms_months)
+    ]
+    for rate, row in zip(rates, grid):
+        lines.append(
+            "{:8.2f}".format(rate) + "".join("{:>13.2f}".format(payment) for payment in row)
+        )
+    text.insert(tk.END, "\n".join(lines))
+
+
+def _build_result_buttons(root, entries):
+    """Builds the row of calculation buttons shown above the result fields.
+
+    Params:
+        root (Tk()): tkinter widget or main window
+        entries (dict): dictionary of GUI entries
+    """
+    row = tk.Frame(root)
+    buttons = (
+        ("Total Monthly Payment", call_calculate_total_monthly_payment),
+        ("Time to Repay", call_calculate_time_to_repay),
+        ("Monthly Take-home Salary", call_calculate_monthly_takehome),
+        ("Amortization Table", call_show_payment_grid),
     )
-    if float(entries["Loan Amount"].get()) == 0:
-        monthly_payment_base = 0
-        additional_monthly_payment = float(0)
-    else:
-        monthly_payment_base = calculate_monthly_payment(
-            float(entries["Loan Amount"].get()),
-            float(entries["Annual Interest Rate"].get()),
-            float(entries["Loan Term"].get()),
-            loan_term_units=str(entries["Loan Term Units"].get()),
+    for text, handler in buttons:
+        button = tk.Button(
+            row,
+            text=text,
+            command=(
+                lambda e=entries, h=handler: h(e)
+            )
         )
-        additional_monthly_payment = float(entries["Additional Monthly Payment"].get())
-    entries["Monthly Take-home Salary"].delete(0, tk.END)
-    if not isinstance(monthly_takehome, str) and not isinstance(monthly_payment_base, str):
-        entries["Monthly Take-home Salary"].insert(0, "{:.2f}".format(monthly_takehome - monthly_payment_base - additional_monthly_payment))
-    elif isinstance(monthly_takehome, str):
-        entries["Monthly Take-home Salary"].insert(0, monthly_takehome)  # error for salary calculation
-    elif isinstance(monthly_payment_base, str):
-        entries["Monthly Take-home Salary"].insert(0, monthly_payment_base)  # error from loan calculation
+        button.pack(side=tk.LEFT, padx=5, pady=5)
+    row.pack(side=tk.TOP,
+             fill=tk.X,
+             padx=5,
+             pady=5)
+
+
+def _build_unit_radios(row, entries, variable, entries_key):
+    """Builds the months/years radiobuttons attached to a field row.
+
+    Params:
+        row (Frame): the field row to attach the radiobuttons to
+        entries (dict): dictionary of GUI entries
+        variable (StringVar): variable shared by the radiobuttons
+        entries_key (str): key to store the variable under in entries
+    """
+    for unit in ("months", "years"):
+        tk.Radiobutton(
+            row,
+            text=unit,
+            padx=5,
+            variable=variable,
+            value=unit
+        ).pack(side=tk.RIGHT)
+    entries[entries_key] = variable
 
 
 def make_form(root):
@@ -244,43 +518,27 @@ def make_form(root):
     ]
     loan_term_units = tk.StringVar(root, "Loan Term Units")
     repay_time_units = tk.StringVar(root, "Repay Time Units")
+    pre_field_hooks = {
+        "Total Monthly Payment": _build_result_buttons,
+    }
+    row_hooks = {
+        "Loan Term": functools.partial(
+            _build_unit_radios, variable=loan_term_units, entries_key="Loan Term Units"
+        ),
+        "Time to Repay": functools.partial(
+            _build_unit_radios, variable=repay_time_units, entries_key="Repay Time Units"
+        ),
+    }
 
     for field in fields:
-        if field == "Total Monthly Payment":
-            row = tk.Frame(root)
-            button_total_monthly_payment = tk.Button(
-                row,
-                text="Total Monthly Payment",
-                command=(
-                    lambda e=entries: call_calculate_total_monthly_payment(e)
-                )
-            )
-            button_total_monthly_payment.pack(side=tk.LEFT, padx=5, pady=5)
-            button_time_to_repay = tk.Button(
-                row,
-                text="Time to Repay",
-                command=(
-                    lambda e=entries: call_calculate_time_to_repay(e)
-                )
-            )
-            button_time_to_repay.pack(side=tk.LEFT, padx=5, pady=5)
-            button_monthly_takehome_salary = tk.Button(
-                row,
-                text="Monthly Take-home Salary",
-                command=(
-                    lambda e=entries: call_calculate_monthly_takehome(e)
-                )
-            )
-            button_monthly_takehome_salary.pack(side=tk.LEFT, padx=5, pady=5)
-            row.pack(side=tk.TOP, 
-                     fill=tk.X, 
-                     padx=5, 
-                     pady=5)
-        
+        pre_hook = pre_field_hooks.get(field)
+        if pre_hook:
+            pre_hook(root, entries)
+
         row = tk.Frame(root)
         lab = tk.Label(row, width=22, text=field+": ", anchor='w')
-        ent = tk.Entry(row)
-        ent.insert(0, "0")
+        var = tk.DoubleVar(root, 0.0)
+        ent = tk.Entry(row, textvariable=var)
         row.pack(side=tk.TOP,
                  fill=tk.X, 
                  padx=5, 
@@ -289,45 +547,27 @@ def make_form(root):
         if field in percent_fields:
             unit = tk.Label(row, text="%")
             unit.pack(side=tk.RIGHT)
-        if field == "Loan Term":
-            tk.Radiobutton(
-                row,
-                text="months",
-                padx = 5,
-                variable=loan_term_units,
-                value="months"
-            ).pack(side=tk.RIGHT)
-            tk.Radiobutton(
-                row,
-                text="years",
-                padx = 5,
-                variable=loan_term_units,
-                value="years"
-            ).pack(side=tk.RIGHT)
-            entries["Loan Term Units"] = loan_term_units
-        if field == "Time to Repay":
-            tk.Radiobutton(
-                row,
-                text="months",
-                padx = 5,
-                variable=repay_time_units,
-                value="months"
-            ).pack(side=tk.RIGHT)
-            tk.Radiobutton(
-                row,
-                text="years",
-                padx = 5,
-                variable=repay_time_units,
-                value="years"
-            ).pack(side=tk.RIGHT)
-            entries["Repay Time Units"] = repay_time_units
-        ent.pack(side=tk.RIGHT, 
-                 expand=tk.YES, 
+        row_hook = row_hooks.get(field)
+        if row_hook:
+            row_hook(row, entries)
+        ent.pack(side=tk.RIGHT,
+                 expand=tk.YES,
                  fill=tk.X)
-        entries[field] = ent
+        entries[field] = var
         if field in money_fields:
             unit = tk.Label(row, text="$")
             unit.pack(side=tk.RIGHT)
+
+    row = tk.Frame(root)
+    text_amortization = tk.Text(row, height=11)
+    text_amortization.pack(side=tk.LEFT,
+                           expand=tk.YES,
+                           fill=tk.X)
+    row.pack(side=tk.TOP,
+             fill=tk.X,
+             padx=5,
+             pady=5)
+    entries["Amortization Table"] = text_amortization
     return entries
     
 